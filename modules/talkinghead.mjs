@@ -1657,8 +1657,11 @@ class TalkingHead {
   * Reset all the visemes for lips.
   */
   resetLips() {
-    Object.values(this.visemes).forEach( x => {
-      this.morphs.forEach( y => y.morphTargetInfluences[y.morphTargetDictionary['viseme_'+x]] );
+    new Set(Object.values(this.visemes)).forEach( x => {
+      this.morphs.forEach( y => {
+        const i = y.morphTargetDictionary['viseme_'+x];
+        if ( i !== undefined ) y.morphTargetInfluences[i] = 0;
+      });
     });
   }
 